@@ -22,7 +22,7 @@ import signal
 import subprocess
 import tempfile
 from pathlib import Path
-from threading import RLock
+from threading import Lock
 from typing import Dict, Iterable, Optional, Union
 
 import numpy as np
@@ -83,7 +83,7 @@ class AudioHAL:
         self._bg_volume: float = 1.0
         self._bg_position: int = 0
 
-        self._mixer_lock = RLock()
+        self._mixer_lock = Lock()
 
         # Callback must be defined inline in order to capture "self"
         @ctypes.CFUNCTYPE(None, ctypes.c_int)
@@ -1,11 +1,12 @@
 #!/usr/bin/env python3
 import os
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from enum import IntEnum
-from queue import Queue
-from threading import Event, RLock, Semaphore, Thread
-from typing import Any, Dict, Optional
+from queue import Empty, SimpleQueue
+from threading import Event, Thread
+from typing import Any, Deque, Dict, Optional, Tuple
 
 from mycroft.messagebus import Message
 from mycroft.messagebus.client import MessageBusClient
@@ -22,15 +23,32 @@ class ForegroundChannel(IntEnum):
     SPEECH = 1
 
 
+class TTSCommand(IntEnum):
+    """Commands sent from bus handlers to the speech thread"""
+
+    START = 0
+    CHUNK = 1
+    STOP = 2
+
+
 # Fixed sample rate for sound effects
 EFFECT_SAMPLE_RATE = 48_000  # Hz
 EFFECT_CHANNELS = 2
 
+# Only local files are supported for sound effects and TTS
+FILE_URI_PREFIX = "file://"
+
+# Real-time priority (1-99) requested for the speech thread
+SPEECH_THREAD_PRIORITY = 10
+
+# Fallback if real-time scheduling is not permitted
+SPEECH_THREAD_NICE = -5
+
 
 # -----------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(frozen=True)
 class TTSRequest:
     """Chunk of TTS audio to play.
 
@@ -39,12 +57,21 @@ class TTSRequest:
 
     Chunks belonging to the same original sentence or paragraph share the same
     session id.
+
+    Requests are immutable once queued, and use slots since one is created
+    for every chunk (dataclass(slots=True) requires Python 3.10).
     """
 
+    __slots__ = ("uri", "chunk_index", "num_chunks", "text", "file_path")
+
     uri: str
     chunk_index: int
     num_chunks: int
-    text: Optional[str] = None
+    text: Optional[str]
+
+    # Local file to play, or None if uri is not an existing file.
+    # Checked when the chunk is queued to keep stat() off the speech thread.
+    file_path: Optional[str]
 
     @property
     def is_first_chunk(self):
@@ -58,55 +85,66 @@ class TTSRequest:
 @dataclass
 class TTSSession:
     mycroft_session_id: Optional[str] = None
-    chunk_queue: "Queue[TTSRequest]" = field(default_factory=Queue)
-    speech_finished: Event = field(default_factory=Event)
+    chunk_queue: Deque[TTSRequest] = field(default_factory=deque)
     is_finished: bool = False
 
 
+# (command, mycroft_session_id, request)
+TTSCommandItem = Tuple[TTSCommand, Optional[str], Optional[TTSRequest]]
+
+
 class RepeatingTimer(Thread):
     """Repeatedly calls a function at a fixed interval in a separate thread"""
 
     def __init__(self, interval: float, function):
         self.interval = interval
         self.function = function
-        self.cancelled = False
+        self._cancelled = Event()
 
         super().__init__()
 
     def cancel(self):
-        self.cancelled = True
+        self._cancelled.set()
 
     def start(self):
-        self.cancelled = False
+        self._cancelled.clear()
         super().start()
 
     def run(self):
-        seconds_to_wait = self.interval
-
-        while True:
-            if self.cancelled:
-                break
-
-            time.sleep(seconds_to_wait)
-
-            if self.cancelled:
-                break
-
-            start_time = time.time()
+        # Schedule against the monotonic clock so the interval doesn't drift
+        # with the function's run time or jump with the system clock.
+        next_time = time.monotonic() + self.interval
 
+        # Waiting on the event lets cancel() interrupt immediately
+        while not self._cancelled.wait(max(0, next_time - time.monotonic())):
             try:
                 self.function()
             except Exception:
                 LOG.exception("timer")
 
-            end_time = time.time()
+            # Don't try to catch up on missed intervals
+            next_time = max(next_time + self.interval, time.monotonic())
 
-            if self.cancelled:
-                break
 
-            # Take run time of function into account to avoid drift
-            seconds_elapsed = end_time - start_time
-            seconds_to_wait = max(0, self.interval - seconds_elapsed)
+def raise_thread_priority():
+    """Raises the scheduling priority of the calling thread.
+
+    Tries real-time scheduling first, then a lower nice value. Both require
+    CAP_SYS_NICE, so the thread is left alone if neither is permitted.
+    On Linux, these only apply to the calling thread.
+    """
+    try:
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(SPEECH_THREAD_PRIORITY))
+        LOG.debug("Using real-time scheduling for thread")
+        return
+    except (AttributeError, OSError):
+        pass
+
+    try:
+        os.nice(SPEECH_THREAD_NICE)
+        LOG.debug("Lowered nice value of thread")
+    except OSError:
+        LOG.debug("Not permitted to raise thread priority")
 
 
 # -----------------------------------------------------------------------------
@@ -127,40 +165,52 @@ class AudioUserInterface:
 
         # Sounds
         start_listening = self.config["sounds"]["start_listening"]
-        self._start_listening_uri: Optional[str] = None
+        self._start_listening_path: Optional[str] = None
 
         if start_listening:
-            self._start_listening_uri = "file://" + resolve_resource_file(
-                start_listening
-            )
+            # Resolved once so playing the sound doesn't need to parse a URI
+            self._start_listening_path = resolve_resource_file(start_listening)
 
         self._bg_position_timer = RepeatingTimer(1.0, self.send_stream_position)
         self._stream_session_id: Optional[str] = None
 
-        self._sessions: Dict[str, TTSSession] = {}
+        # Last position sent for the background stream (-1 if none)
+        self._last_position_ms: int = -1
+
+        # TTS session state is owned by the speech thread.
+        # Bus handlers only put commands into this queue.
+        # None is put on shutdown to wake the speech thread.
+        self._tts_commands: "SimpleQueue[Optional[TTSCommandItem]]" = SimpleQueue()
         self._speech_thread: Optional[Thread] = None
+        self._speech_finished = Event()
+
+        # Messages from the speech thread are sent by a separate thread, so
+        # speaking is never delayed by the websocket.
+        # None is put on shutdown to stop the thread.
+        self._speech_messages: "SimpleQueue[Optional[Message]]" = SimpleQueue()
+        self._speech_emit_thread: Optional[Thread] = None
+
+        # Most recent session from the bus, used to interrupt speech immediately
         self._mycroft_session_id: Optional[str] = None
-        self._speech_ready = Semaphore()
-        # self._speech_finished = Event()
-        self._session_lock = RLock()
-
-        self._bus_events = {
-            "recognizer_loop:record_begin": self.handle_start_listening,
-            "recognizer_loop:record_end": self.handle_end_listening,
-            "recognizer_loop:audio_output_start": self.handle_tts_started,
-            "recognizer_loop:audio_output_end": self.handle_tts_finished,
-            "mycroft.audio.play-sound": self.handle_play_sound,
-            "mycroft.tts.stop": self._stop_tts,
-            "mycroft.tts.session.start": self.handle_tts_session_start,
-            # "mycroft.tts.session.end": self.handle_tts_session_end,
-            "mycroft.tts.chunk.start": self.handle_tts_chunk,
-            "mycroft.audio.hal.media.ended": self.handle_media_finished,
+
+        # (event name, handler) pairs registered on the bus
+        self._bus_events = (
+            ("recognizer_loop:record_begin", self.handle_start_listening),
+            ("recognizer_loop:record_end", self.handle_end_listening),
+            ("recognizer_loop:audio_output_start", self.handle_tts_started),
+            ("recognizer_loop:audio_output_end", self.handle_tts_finished),
+            ("mycroft.audio.play-sound", self.handle_play_sound),
+            ("mycroft.tts.stop", self._stop_tts),
+            ("mycroft.tts.session.start", self.handle_tts_session_start),
+            # ("mycroft.tts.session.end", self.handle_tts_session_end),
+            ("mycroft.tts.chunk.start", self.handle_tts_chunk),
+            ("mycroft.audio.hal.media.ended", self.handle_media_finished),
             # stream
-            "mycroft.audio.service.play": self.handle_stream_play,
-            "mycroft.audio.service.pause": self.handle_stream_pause,
-            "mycroft.audio.service.resume": self.handle_stream_resume,
-            "mycroft.audio.service.stop": self.handle_stream_stop,
-        }
+            ("mycroft.audio.service.play", self.handle_stream_play),
+            ("mycroft.audio.service.pause", self.handle_stream_pause),
+            ("mycroft.audio.service.resume", self.handle_stream_resume),
+            ("mycroft.audio.service.stop", self.handle_stream_stop),
+        )
 
         self._is_running = True
 
@@ -171,6 +221,9 @@ class AudioUserInterface:
         self._ahal.initialize(self.bus)
 
         # TTS queue/thread
+        self._speech_emit_thread = Thread(target=self._speech_emit_run, daemon=True)
+        self._speech_emit_thread.start()
+
         self._speech_thread = Thread(target=self._speech_run, daemon=True)
         self._speech_thread.start()
 
@@ -180,7 +233,7 @@ class AudioUserInterface:
 
     def _attach_events(self):
         """Adds bus event handlers"""
-        for event_name, handler in self._bus_events.items():
+        for event_name, handler in self._bus_events:
             self.bus.on(event_name, handler)
 
     def shutdown(self):
@@ -194,24 +247,33 @@ class AudioUserInterface:
 
             if self._speech_thread is not None:
                 self._ahal.stop_foreground(ForegroundChannel.SPEECH)
-                self._speech_ready.release()
+
+                # Bus events are detached, so media ended will never arrive
+                self._tts_commands.put(None)
+                self._speech_finished.set()
                 self._speech_thread.join()
                 self._speech_thread = None
 
+            if self._speech_emit_thread is not None:
+                # Messages already queued are still sent
+                self._speech_messages.put(None)
+                self._speech_emit_thread.join()
+                self._speech_emit_thread = None
+
             self._ahal.shutdown()
         except Exception:
             LOG.exception("error shutting down")
 
     def _detach_events(self):
         """Removes bus event handlers"""
-        for event_name, handler in self._bus_events.items():
+        for event_name, handler in self._bus_events:
             self.bus.remove(event_name, handler)
 
     # -------------------------------------------------------------------------
 
     def _stop_tts(self, _message=None):
-        with self._session_lock:
-            self._mycroft_session_id = None
+        self._mycroft_session_id = None
+        self._tts_commands.put((TTSCommand.STOP, None, None))
 
         # Stop any TTS currently speaking
         self._ahal.stop_foreground(ForegroundChannel.SPEECH)
@@ -243,8 +305,8 @@ class AudioUserInterface:
         self._duck_volume()
         self._stop_tts()
 
-        if self._start_listening_uri and (self.config.get("confirm_listening", False)):
-            self._play_effect(self._start_listening_uri)
+        if self._start_listening_path and (self.config.get("confirm_listening", False)):
+            self._play_effect_path(self._start_listening_path)
 
     def handle_end_listening(self, _message):
         self._unduck_volume()
@@ -257,33 +319,36 @@ class AudioUserInterface:
     ):
         """Play sound effect from uri"""
         if uri:
-            assert uri.startswith("file://"), "Only file URIs are supported for effects"
-            file_path = uri[len("file://") :]
-            self._ahal.play_foreground(
-                ForegroundChannel.EFFECT,
-                file_path,
-                volume=volume,
-                mycroft_session_id=mycroft_session_id,
+            assert uri.startswith(FILE_URI_PREFIX), "Effects must be file URIs"
+            file_path = uri.removeprefix(FILE_URI_PREFIX)
+            self._play_effect_path(
+                file_path, volume=volume, mycroft_session_id=mycroft_session_id
             )
-            LOG.info("Played sound: %s", uri)
+
+    def _play_effect_path(
+        self,
+        file_path: str,
+        volume: Optional[float] = None,
+        mycroft_session_id: Optional[str] = None,
+    ):
+        """Play sound effect from a local file path"""
+        self._ahal.play_foreground(
+            ForegroundChannel.EFFECT,
+            file_path,
+            volume=volume,
+            mycroft_session_id=mycroft_session_id,
+        )
+        LOG.info("Played sound: %s", file_path)
 
     def handle_tts_session_start(self, message):
         mycroft_session_id = message.data.get("mycroft_session_id")
+        is_different_session = mycroft_session_id != self._mycroft_session_id
+        self._mycroft_session_id = mycroft_session_id
+        self._tts_commands.put((TTSCommand.START, mycroft_session_id, None))
 
-        with self._session_lock:
-            is_different_session = mycroft_session_id != self._mycroft_session_id
-
-            session = self._sessions.get(mycroft_session_id)
-            if session is None:
-                session = TTSSession(mycroft_session_id=mycroft_session_id)
-                self._sessions[mycroft_session_id] = session
-
-            session.is_finished = False
-            self._mycroft_session_id = mycroft_session_id
-
-            if is_different_session:
-                # Stop any TTS currently speaking
-                self._ahal.stop_foreground(ForegroundChannel.SPEECH)
+        if is_different_session:
+            # Stop any TTS currently speaking
+            self._ahal.stop_foreground(ForegroundChannel.SPEECH)
 
         LOG.debug(
             "Started TTS session %s",
@@ -298,37 +363,24 @@ class AudioUserInterface:
         num_chunks = message.data.get("num_chunks", 1)
         text = message.data.get("text")
 
-        with self._session_lock:
-            if mycroft_session_id != self._mycroft_session_id:
-                # Doesn't match session from tts.session.start
-                LOG.debug(
-                    "Dropping TTS chunk from cancelled session %s: %s",
-                    mycroft_session_id,
-                    text,
-                )
-                return
-
-        session = self._sessions.get(mycroft_session_id)
-        if session is not None:
-            request = TTSRequest(
-                uri=uri,
-                chunk_index=chunk_index,
-                num_chunks=num_chunks,
-                text=text,
-            )
-            session.chunk_queue.put(request)
-            self._speech_ready.release()
-
-            LOG.info(
-                "Queued TTS chunk %s/%s: %s (session=%s): %s",
-                chunk_index + 1,
-                num_chunks,
-                uri,
-                mycroft_session_id,
-                text,
-            )
-        else:
-            LOG.error("TTS session was not started: %s", mycroft_session_id)
+        # TODO: Support other URI types
+        file_path: Optional[str] = None
+        if uri.startswith(FILE_URI_PREFIX):
+            file_path = uri.removeprefix(FILE_URI_PREFIX)
+            if not os.path.isfile(file_path):
+                file_path = None
+
+        if file_path is None:
+            LOG.warning("TTS chunk will not be played (missing file): %s", uri)
+
+        request = TTSRequest(
+            uri=uri,
+            chunk_index=chunk_index,
+            num_chunks=num_chunks,
+            text=text,
+            file_path=file_path,
+        )
+        self._tts_commands.put((TTSCommand.CHUNK, mycroft_session_id, request))
 
     def handle_tts_started(self, _message: Message):
         self._duck_volume()
@@ -344,10 +396,8 @@ class AudioUserInterface:
 
         if channel == ForegroundChannel.SPEECH:
             # Signal speech thread to play next TTS chunk
-            session = self._sessions.get(media_id)
-            if session is not None:
-                LOG.debug("TTS chunk finished playing for session %s", media_id)
-                session.speech_finished.set()
+            LOG.debug("TTS chunk finished playing for session %s", media_id)
+            self._speech_finished.set()
         elif background:
             # Signal background stream complete
             LOG.info("Background stream finished")
@@ -358,126 +408,206 @@ class AudioUserInterface:
                 )
             )
 
+    def _apply_tts_commands(
+        self,
+        sessions: Dict[Optional[str], TTSSession],
+        active_session: Optional[TTSSession],
+        block: bool,
+    ) -> Optional[TTSSession]:
+        """Applies pending commands from bus handlers to the session state.
+
+        Only called from the speech thread. Returns the active session.
+        """
+        while True:
+            try:
+                item = self._tts_commands.get(block=block)
+            except Empty:
+                break
+
+            if item is None:
+                # Shutdown
+                break
+
+            command, session_id, request = item
+
+            # Only wait for the first command
+            block = False
+
+            if command == TTSCommand.START:
+                if (active_session is None) or (
+                    active_session.mycroft_session_id != session_id
+                ):
+                    active_session = sessions.get(session_id)
+                    if active_session is None:
+                        active_session = TTSSession(mycroft_session_id=session_id)
+                        sessions[session_id] = active_session
+
+                    # Clean up other sessions when switching
+                    other_session_ids = [
+                        other_id for other_id in sessions if other_id != session_id
+                    ]
+                    for other_id in other_session_ids:
+                        cancelled_session = sessions.pop(other_id)
+                        # Finish session to ensure events are sent out
+                        if not cancelled_session.is_finished:
+                            cancelled_session.is_finished = True
+                            self._finish_tts_session(mycroft_session_id=other_id)
+
+                        LOG.debug("Cleaned up TTS session %s", other_id)
+
+                active_session.is_finished = False
+            elif command == TTSCommand.CHUNK:
+                assert request is not None
+
+                if (active_session is None) or (
+                    active_session.mycroft_session_id != session_id
+                ):
+                    # Doesn't match session from tts.session.start
+                    LOG.debug(
+                        "Dropping TTS chunk from cancelled session %s: %s",
+                        session_id,
+                        request.text,
+                    )
+                    continue
+
+                active_session.chunk_queue.append(request)
+                LOG.info(
+                    "Queued TTS chunk %s/%s: %s (session=%s): %s",
+                    request.chunk_index + 1,
+                    request.num_chunks,
+                    request.uri,
+                    session_id,
+                    request.text,
+                )
+            elif command == TTSCommand.STOP:
+                active_session = None
+
+        return active_session
+
     def _speech_run(self):
         """Thread proc for text to speech"""
+        # Reduce gaps between chunks when the system is busy
+        raise_thread_priority()
+
+        # Session state is private to this thread, so no locking is needed
+        sessions: Dict[Optional[str], TTSSession] = {}
+        session: Optional[TTSSession] = None
+
         try:
             while self._is_running:
-                self._speech_ready.acquire()
-
-                with self._session_lock:
-                    session = self._sessions.get(self._mycroft_session_id)
-                    if session is None:
-                        # No session for id
-                        continue
-
-                    # Clean up other sessions
-                    all_session_ids = list(self._sessions.keys())
-                    for session_id in all_session_ids:
-                        if session_id != self._mycroft_session_id:
-                            cancelled_session = self._sessions.pop(session_id, None)
-                            # Finish session to ensure events are sent out
-                            if not cancelled_session.is_finished:
-                                cancelled_session.is_finished = True
-                                self._finish_tts_session(
-                                    mycroft_session_id=session_id,
-                                )
-
-                            LOG.debug("Cleaned up TTS session %s", session_id)
-
-                if session.chunk_queue.empty():
-                    # No TTS chunks
-                    continue
+                # Only wait for a command if there is nothing left to speak
+                is_idle = (session is None) or (not session.chunk_queue)
+                session = self._apply_tts_commands(sessions, session, block=is_idle)
 
-                request = session.chunk_queue.get()
-                self.bus.emit(
-                    Message(
-                        "recognizer_loop:audio_output_start",
-                        data={"mycroft_session_id": session.mycroft_session_id},
-                    )
-                )
-
-                # TODO: Support other URI types
-                assert request.uri.startswith("file://")
-                file_path = request.uri[len("file://") :]
-
-                self.bus.emit(
-                    Message(
-                        "mycroft.tts.chunk.started",
-                        data={
-                            "mycroft_session_id": session.mycroft_session_id,
-                            "chunk_index": request.chunk_index,
-                            "num_chunks": request.num_chunks,
-                            "uri": request.uri,
-                            "text": request.text,
-                        },
-                    )
-                )
+                if not self._is_running:
+                    break
 
-                # Play TTS chunk
-                session.speech_finished.clear()
-                if os.path.isfile(file_path):
-                    duration_sec = self._ahal.play_foreground(
-                        ForegroundChannel.SPEECH,
-                        file_path,
-                        media_id=session.mycroft_session_id,
-                        mycroft_session_id=session.mycroft_session_id,
-                    )
+                if session is None:
+                    # No active session
+                    continue
 
-                    if duration_sec is not None:
-                        LOG.info(
-                            "Speaking TTS chunk %s/%s for %s sec from session %s",
-                            request.chunk_index + 1,
-                            request.num_chunks,
-                            duration_sec,
-                            session.mycroft_session_id,
+                # Speak queued chunks until the queue is empty or the session
+                # changes, announcing output only once for the whole run.
+                is_first_in_run = True
+                while session.chunk_queue:
+                    request = session.chunk_queue.popleft()
+
+                    if is_first_in_run:
+                        is_first_in_run = False
+                        self._speech_messages.put(
+                            Message(
+                                "recognizer_loop:audio_output_start",
+                                data={"mycroft_session_id": session.mycroft_session_id},
+                            )
                         )
 
-                        # Wait at most a half second after TTS should have been finished.
-                        # This event is set whenever TTS is cleared.
-                        timeout = duration_sec + 0.5
-                        session.speech_finished.wait(timeout=timeout)
-
-                self.bus.emit(
-                    Message(
-                        "mycroft.tts.chunk.ended",
-                        data={
-                            "mycroft_session_id": session.mycroft_session_id,
-                            "chunk_index": request.chunk_index,
-                            "num_chunks": request.num_chunks,
-                            "uri": request.uri,
-                            "text": request.text,
-                        },
-                    )
-                )
+                    self._speak_chunk(session, request)
 
-                if request.is_last_chunk and (not session.is_finished):
-                    session.is_finished = True
-                    self._finish_tts_session(
-                        mycroft_session_id=session.mycroft_session_id,
+                    # Apply commands that arrived during playback (e.g., stop)
+                    active_session = self._apply_tts_commands(
+                        sessions, session, block=False
                     )
 
+                    if (not self._is_running) or (active_session is not session):
+                        session = active_session
+                        break
+
         except Exception:
             LOG.exception("error is speech thread")
 
+    def _speech_emit_run(self):
+        """Thread proc that sends messages from the speech thread in order"""
+        while True:
+            message = self._speech_messages.get()
+            if message is None:
+                # Shutdown
+                break
+
+            try:
+                self.bus.emit(message)
+            except Exception:
+                LOG.exception("error sending speech message")
+
+    def _speak_chunk(self, session: TTSSession, request: TTSRequest):
+        """Plays a single TTS chunk and waits for it to finish.
+
+        Only called from the speech thread.
+        """
+        # Never modified after this, so both messages can share the same data
+        chunk_data = {
+            "mycroft_session_id": session.mycroft_session_id,
+            "chunk_index": request.chunk_index,
+            "num_chunks": request.num_chunks,
+            "uri": request.uri,
+            "text": request.text,
+        }
+
+        self._speech_messages.put(Message("mycroft.tts.chunk.started", data=chunk_data))
+
+        # Play TTS chunk
+        self._speech_finished.clear()
+        if request.file_path is not None:
+            duration_sec = self._ahal.play_foreground(
+                ForegroundChannel.SPEECH,
+                request.file_path,
+                media_id=session.mycroft_session_id,
+                mycroft_session_id=session.mycroft_session_id,
+            )
+
+            if duration_sec is not None:
+                LOG.info(
+                    "Speaking TTS chunk %s/%s for %s sec from session %s",
+                    request.chunk_index + 1,
+                    request.num_chunks,
+                    duration_sec,
+                    session.mycroft_session_id,
+                )
+
+                # Wait at most a half second after TTS should have been finished.
+                # This event is set whenever TTS is cleared.
+                timeout = duration_sec + 0.5
+                self._speech_finished.wait(timeout=timeout)
+
+        self._speech_messages.put(Message("mycroft.tts.chunk.ended", data=chunk_data))
+
+        if request.is_last_chunk and (not session.is_finished):
+            session.is_finished = True
+            self._finish_tts_session(
+                mycroft_session_id=session.mycroft_session_id,
+            )
+
     def _finish_tts_session(
         self,
-        mycroft_session_id: str,
+        mycroft_session_id: Optional[str],
     ):
+        session_data = {"mycroft_session_id": mycroft_session_id}
+
         # Report speaking finished for speak(wait=True)
-        self.bus.emit(
-            Message(
-                "mycroft.tts.session.ended",
-                data={
-                    "mycroft_session_id": mycroft_session_id,
-                },
-            )
+        self._speech_messages.put(
+            Message("mycroft.tts.session.ended", data=session_data)
         )
-
-        self.bus.emit(
-            Message(
-                "recognizer_loop:audio_output_end",
-                data={"mycroft_session_id": mycroft_session_id},
-            )
+        self._speech_messages.put(
+            Message("recognizer_loop:audio_output_end", data=session_data)
         )
 
         LOG.info("TTS session finished: %s", mycroft_session_id)
@@ -494,18 +624,14 @@ class AudioUserInterface:
             LOG.warning("Play message received with not tracks: %s", message.data)
             return
 
-        uri_playlist = []
-        for track in tracks:
-            if isinstance(track, str):
-                # URI
-                uri_playlist.append(track)
-            else:
-                # (URI, mimetype)
-                uri = next(iter(track))
-                uri_playlist.append(uri)
+        # Tracks are either a URI or a (URI, mimetype) pair
+        uri_playlist = [
+            track if isinstance(track, str) else next(iter(track)) for track in tracks
+        ]
 
         # Stop previous stream
         self._ahal.stop_background()
+        self._last_position_ms = -1
 
         self._stream_session_id = message.data.get("mycroft_session_id")
         LOG.info(
@@ -556,6 +682,7 @@ class AudioUserInterface:
             # Don't ever actually stop the background stream.
             # This lets us resume it later at any point.
             self._ahal.pause_background()
+            self._last_position_ms = -1
             self.bus.emit(
                 Message(
                     "mycroft.audio.service.stopped",
@@ -565,10 +692,16 @@ class AudioUserInterface:
 
     def send_stream_position(self):
         """Sends out background stream position to skills"""
-        if not self._ahal.is_background_playing():
+        if (not self._is_running) or (not self._ahal.is_background_playing()):
             return
 
         position_ms = self._ahal.get_background_time()
+        if position_ms == self._last_position_ms:
+            # Don't send duplicate positions, e.g. while the stream is stalled
+            return
+
+        self._last_position_ms = position_ms
+
         if position_ms >= 0:
             self.bus.emit(
                 Message(
@@ -18,6 +18,20 @@ from os.path import expanduser, isdir, join
 
 import xdg.BaseDirectory
 
+_mycroft_config_root = None
+
+
+def _get_mycroft_config_root():
+    """Get the XDG config directory for mycroft, creating it on first use.
+
+    Cached because every skill creates a FileSystemAccess at load time.
+    """
+    global _mycroft_config_root
+    if _mycroft_config_root is None:
+        _mycroft_config_root = xdg.BaseDirectory.save_config_path("mycroft")
+
+    return _mycroft_config_root
+
 
 class FileSystemAccess:
     """A class for providing access to the mycroft FS sandbox.
@@ -30,28 +44,33 @@ class FileSystemAccess:
         #: Member value containing the root path of the namespace
         self.path = self.__init_path(path)
 
+        # Absolute paths of files in the namespace, by filename
+        self._file_paths = {}
+
     @staticmethod
     def __init_path(path):
         if not isinstance(path, str) or len(path) == 0:
             raise ValueError("path must be initialized as a non empty string")
 
         old_path = join(expanduser("~"), ".mycroft", path)
-        path = join(xdg.BaseDirectory.save_config_path("mycroft"), path)
-
-        # Migrate from the old location if it still exists
-        # TODO: remove in 22.02
-        if not isdir(path) and isdir(old_path):
-            # This differs from mainline core
-            # As Mark II's can jump back and forward between pre-xdg and
-            # post-xdg versions of mycroft-core - new paths with valid content
-            # were being deleted. This causes devices to lose pairing info etc
-            shutil.move(old_path, path)
-            # Create a symlink at old_path so users switching back to stable
-            # still have pairing info.
-            os.symlink(path, old_path)
+        path = join(_get_mycroft_config_root(), path)
 
+        # Usually the path already exists, so only stat() it once
         if not isdir(path):
-            os.makedirs(path)
+            # Migrate from the old location if it still exists
+            # TODO: remove in 22.02
+            if isdir(old_path):
+                # This differs from mainline core
+                # As Mark II's can jump back and forward between pre-xdg and
+                # post-xdg versions of mycroft-core - new paths with valid content
+                # were being deleted. This causes devices to lose pairing info etc
+                shutil.move(old_path, path)
+                # Create a symlink at old_path so users switching back to stable
+                # still have pairing info.
+                os.symlink(path, old_path)
+            else:
+                os.makedirs(path, exist_ok=True)
+
         return path
 
     def open(self, filename, mode):
@@ -69,8 +88,7 @@ class FileSystemAccess:
         Returns:
             an open file handle.
         """
-        file_path = join(self.path, filename)
-        return open(file_path, mode)
+        return open(self._get_file_path(filename), mode)
 
     def exists(self, filename):
         """Check if file exists in the namespace.
@@ -81,4 +99,13 @@ class FileSystemAccess:
         Returns:
             bool: True if file exists, else False.
         """
-        return os.path.exists(join(self.path, filename))
+        return os.path.exists(self._get_file_path(filename))
+
+    def _get_file_path(self, filename):
+        """Get the absolute path of a file in the namespace (cached)."""
+        file_path = self._file_paths.get(filename)
+        if file_path is None:
+            file_path = join(self.path, filename)
+            self._file_paths[filename] = file_path
+
+        return file_path
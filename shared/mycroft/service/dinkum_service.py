@@ -46,6 +46,9 @@ class DinkumService(ABC):
         self._notifier = sdnotify.SystemdNotifier()
         self._state: ServiceState = ServiceState.NOT_STARTED
 
+        # Set when the service is stopping (signal, exception, etc.)
+        self._shutdown_event = Event()
+
     @property
     def state(self):
         return self._state
@@ -73,6 +76,7 @@ class DinkumService(ABC):
                 pass
             finally:
                 self._state = ServiceState.STOPPING
+                self._shutdown_event.set()
                 self.stop()
                 self.after_stop()
                 self._state = ServiceState.NOT_STARTED
@@ -118,17 +122,15 @@ class DinkumService(ABC):
         Defaults to blocking until the service is terminated externally.
         """
         # Wait for exit signal
-        run_event = Event()
-
         def signal_handler(_sig, _frame):
             """Registers signal handlers to catch CTRL+C and TERM."""
-            run_event.set()
+            self._shutdown_event.set()
 
         original_int_handler = signal.signal(signal.SIGINT, signal_handler)
         original_term_handler = signal.signal(signal.SIGTERM, signal_handler)
 
         try:
-            run_event.wait()
+            self._shutdown_event.wait()
         finally:
             # Restore original signal handlers
             signal.signal(signal.SIGINT, original_int_handler)
@@ -177,10 +179,11 @@ class DinkumService(ABC):
     def _watchdog(self):
         """Notify systemd that the service is still running"""
         try:
-            while True:
+            # Waiting on the event lets shutdown interrupt the delay
+            while not self._shutdown_event.is_set():
                 # Prevent systemd from restarting service
                 self._notifier.notify("WATCHDOG=1")
-                time.sleep(WATCHDOG_DELAY)
+                self._shutdown_event.wait(WATCHDOG_DELAY)
         except Exception:
             self.log.exception("Unexpected error in watchdog thread")
 
@@ -13,11 +13,14 @@
 # limitations under the License.
 #
 import logging
-from collections import defaultdict
+import os
+import sys
+from collections import defaultdict, deque
+from operator import itemgetter
 from threading import Event, Lock, Thread
 from time import sleep, monotonic
 from queue import Empty, Queue
-from typing import Dict, List, Optional, Set, Union
+from typing import Any, Deque, Dict, List, Optional, Set, Union
 from pathlib import Path
 from uuid import uuid4
 
@@ -39,6 +42,10 @@ def create_voight_kampff_logger():
 
 LOG = create_voight_kampff_logger()
 
+# Used for every speak message
+_get_meta = itemgetter("meta")
+_get_skill_id = itemgetter("skill_id")
+
 
 class InterceptAllBusClient(MessageBusClient):
     """Bus Client storing all messages received.
@@ -46,8 +53,8 @@ class InterceptAllBusClient(MessageBusClient):
     This allows read back of older messages and non-event-driven operation.
     """
 
-    def __init__(self, message_callback):
-        super().__init__()
+    def __init__(self, message_callback, **kwargs):
+        super().__init__(**kwargs)
         self._message_callback = message_callback
 
     def on_message(self, _, message):
@@ -56,12 +63,20 @@ class InterceptAllBusClient(MessageBusClient):
 
 
 class VoightKampffClient:
-    def __init__(self):
-        self.bus = InterceptAllBusClient(self._on_message)
+    def __init__(self, host: Optional[str] = None, port: Optional[int] = None):
+        bus_kwargs: Dict[str, Any] = {}
+        if host:
+            bus_kwargs["host"] = host
+
+        if port:
+            bus_kwargs["port"] = port
+
+        self.bus = InterceptAllBusClient(self._on_message, **bus_kwargs)
 
         self._tts_session_ids: Set[str] = set()
         self._speaking_finished = Event()
-        self._speak_queue: "Queue[Message]" = Queue()
+        self._speak_queue: Deque[Message] = deque()
+        self._speak_added = Event()
 
         self._active_sessions: Set[str] = set()
         self._session_ended = Event()
@@ -159,13 +174,27 @@ class VoightKampffClient:
         assert passed, assert_message
 
     def get_next_speak(self, timeout=10) -> Optional[Message]:
-        message: Optional[Message] = None
-        try:
-            message = self._speak_queue.get(timeout=timeout)
-        except Empty:
-            pass
+        # deque append/popleft are atomic, so only waiting needs the event
+        end_time = monotonic() + timeout
+        while not self._speak_queue:
+            if not self._speak_added.wait(timeout=max(0, end_time - monotonic())):
+                return None
+
+            self._speak_added.clear()
 
-        return message
+        return self._speak_queue.popleft()
+
+    def get_pending_speaks(self, timeout=10) -> List[Message]:
+        """Wait for the next speak message, then drain any others already queued"""
+        messages: List[Message] = []
+        maybe_message = self.get_next_speak(timeout=timeout)
+        if maybe_message is not None:
+            messages.append(maybe_message)
+
+            while self._speak_queue:
+                messages.append(self._speak_queue.popleft())
+
+        return messages
 
     def reset_state(self):
         self.messages.clear()
@@ -175,8 +204,8 @@ class VoightKampffClient:
         self._session_ended.clear()
         self._speaking_finished.clear()
 
-        while not self._speak_queue.empty():
-            self._speak_queue.get()
+        self._speak_added.clear()
+        self._speak_queue.clear()
 
     def shutdown(self):
         self.bus.close()
@@ -186,7 +215,18 @@ class VoightKampffClient:
         if tts_session_id:
             self._tts_session_ids.add(tts_session_id)
 
-        self._speak_queue.put_nowait(message)
+        # Interned so comparisons with (interned) expected skill ids are cheap
+        try:
+            meta = _get_meta(message.data)
+            skill_id = _get_skill_id(meta)
+            if isinstance(skill_id, str):
+                meta["skill_id"] = sys.intern(skill_id)
+        except (KeyError, TypeError):
+            # Missing or empty meta
+            pass
+
+        self._speak_queue.append(message)
+        self._speak_added.set()
 
     def _handle_speaking_finished(self, message: Message):
         # if message.data.get("mycroft_session_id") in self._active_sessions:
@@ -216,7 +256,30 @@ class VoightKampffClient:
 
 
 def before_all(context):
-    context.client = VoightKampffClient()
+    userdata = context.config.userdata
+    host = userdata.get("bus_host")
+    port = userdata.get("bus_port")
+    if port:
+        port = _parse_int(port, "bus_port")
+
+    # Parallel runners (e.g., behavex) assign each worker an id.
+    # Each worker is expected to have its own Mycroft instance whose bus
+    # port is offset from the base port by that id.
+    worker_id = os.environ.get("BEHAVE_WORKER_ID")
+    if worker_id:
+        if not port:
+            port = int(Configuration.get()["websocket"]["port"])
+
+        port += _parse_int(worker_id, "BEHAVE_WORKER_ID")
+
+    context.client = VoightKampffClient(host=host, port=port)
+
+
+def _parse_int(value: str, name: str) -> int:
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer, got '{value}'") from None
 
 
 def before_feature(context, feature):
@@ -17,15 +17,20 @@ Predefined step definitions for handling dialog interaction with Mycroft for
 use with behave.
 """
 import logging
+import os
+from functools import lru_cache
 from os.path import join, exists, basename
-from glob import glob
 import re
+import sys
 import time
+from operator import itemgetter
 from pathlib import Path
+from typing import Optional, Pattern, Tuple
 
-from behave import given, when, then
+from behave import given, when, then, use_step_matcher
 
 from mycroft.messagebus import Message
+from mycroft.skills.skill_data import ResourceType
 
 from test.integrationtests.voight_kampff import (
     mycroft_responses,
@@ -33,12 +38,196 @@ from test.integrationtests.voight_kampff import (
     then_wait_fail,
 )
 
+# Same logger configured in environment.py (not __name__, which would bypass
+# its handler)
 LOG = logging.getLogger("Voight Kampff")
 
+# Used to turn dialog lines into regular expressions (see _compile_dialog)
+_SLOT_OR_BRACE_RE = re.compile(r"\{.*?\}|\}")
+_WILDCARDS_OR_WHITESPACE_RE = re.compile(r"\.\*( \.\*)+|\s+")
+_REGEX_SYNTAX_RE = re.compile(r"[.^$*+?{}\[\]\\|()]")
+
+_get_utterance = itemgetter("utterance")
+
+# Has no data, so the same message can be sent every time
+_STOP_MESSAGE = Message("mycroft.tts.stop")
+
+
+@lru_cache(maxsize=1024)
+def load_dialog_file(dialog_path: str) -> Tuple[str, ...]:
+    """Load dialog files and get the contents.
+
+    Cached since dialog files are assumed not to change during a test run.
+    """
+    with open(dialog_path) as f:
+        lines = f.readlines()
+    return tuple(
+        line.strip().lower()
+        for line in lines
+        if line.strip() != "" and line.strip()[0] != "#"
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_dialog_paths(skill_path: str, lang: str) -> Tuple[str, ...]:
+    """Get paths of all dialog files for a skill (skills don't change mid-run)."""
+    # Same directories the skill itself loads dialogs from
+    dialog_type = ResourceType("dialog", ".dialog", lang)
+    dialog_type.locate_base_directory(skill_path)
+    if dialog_type.base_directory is None:
+        return tuple()
+
+    # Skills may organize dialogs into subdirectories
+    return tuple(
+        join(directory, file_name)
+        for directory, _, file_names in os.walk(str(dialog_type.base_directory))
+        for file_name in file_names
+        if file_name.endswith(".dialog")
+    )
+
+
+def _literal_prefix(regex: Pattern) -> Tuple[str, bool]:
+    """Get the literal text any match of a dialog regex must start with.
+
+    Returns (prefix, is_literal) where is_literal is True when the regex is
+    nothing but its prefix.
+    """
+    # Strip leading '^'
+    body = regex.pattern[1:]
+    syntax_match = _REGEX_SYNTAX_RE.search(body)
+    if syntax_match is None:
+        return body, True
+
+    # Alternation may not be anchored, and escapes/character classes make it
+    # hard to tell, so don't guess
+    if ("|" in body) or ("\\" in body) or ("[" in body):
+        return "", False
+
+    end = syntax_match.start()
+    if body[end] in "?*+{":
+        # Quantifier applies to the previous character
+        end = max(0, end - 1)
+
+    return body[:end], False
+
+
+@lru_cache(maxsize=None)
+def _build_skill_index(
+    skill_path: str, lang: str
+) -> Tuple[Tuple[Pattern, str, bool, int, str], ...]:
+    """Build (regex, prefix, is literal, pattern length, dialog file name) for
+    every dialog line.
+
+    Lines are kept in file order so the first match in each file wins.
+    Lines whose sentence doesn't start with the prefix can be skipped without
+    running the regex; literal lines don't need the regex at all.
+    """
+    index = []
+    for path in _get_dialog_paths(skill_path, lang):
+        dialog_name = basename(path)
+        for pattern in load_dialog_file(path):
+            regex = _compile_dialog(pattern)
+            if regex is not None:
+                prefix, is_literal = _literal_prefix(regex)
+                index.append((regex, prefix, is_literal, len(pattern), dialog_name))
+
+    return tuple(index)
+
+
+@lru_cache(maxsize=None)
+def _get_skill_prefixes(skill_path: str, lang: str) -> Optional[Tuple[str, ...]]:
+    """Get prefixes of all dialog lines for a skill.
+
+    Returns None if any line could match a sentence starting with anything.
+    """
+    prefixes = set()
+    for _, prefix, _, _, _ in _build_skill_index(skill_path, lang):
+        if not prefix:
+            return None
+
+        prefixes.add(prefix)
+
+    return tuple(prefixes)
+
+
+def dialog_from_sentence(sentence: str, skill_path: str, lang: str) -> Optional[str]:
+    """Find dialog file from example sentence."""
+    sentence = sentence.lower()
+
+    # Quick check if any dialog line could match
+    prefixes = _get_skill_prefixes(skill_path, lang)
+    if (prefixes is not None) and (not sentence.startswith(prefixes)):
+        return None
+
+    best: Tuple[Optional[str], int] = (None, 0)
+    matched_names = set()
+    for regex, prefix, is_literal, pattern_len, dialog_name in _build_skill_index(
+        skill_path, lang
+    ):
+        if dialog_name in matched_names:
+            continue
+
+        if not sentence.startswith(prefix):
+            continue
+
+        is_match = is_literal or (regex.match(sentence) is not None)
+
+        if is_match:
+            matched_names.add(dialog_name)
+            if pattern_len > best[1]:
+                best = (dialog_name, pattern_len)
+
+    return best[0]
+
+
+def _replace_slot_or_brace(match) -> str:
+    return ".*" if match.group(0).startswith("{") else ""
+
+
+def _replace_wildcards_or_whitespace(match) -> str:
+    return ".*" if match.group(0).startswith(".") else " "
+
+
+@lru_cache(maxsize=4096)
+def _compile_dialog(dialog: str) -> Optional[Pattern]:
+    """Convert a dialog line into a compiled regular expression.
+
+    Cached since the same dialog lines are tried against every example.
+    Returns None if the line can't be converted (e.g., unbalanced groups).
+    """
+    # Allow custom fields to be anything and remove left over '}'
+    dialog = _SLOT_OR_BRACE_RE.sub(_replace_slot_or_brace, dialog)
+
+    # Everything between the first and last space can be anything
+    first_space = dialog.find(" ")
+    last_space = dialog.rfind(" ")
+    if first_space < last_space:
+        dialog = dialog[:first_space] + " .*" + dialog[last_space + 1 :]
+
+    # Merge consecutive .*'s into a single .* and remove double whitespaces
+    dialog = _WILDCARDS_OR_WHITESPACE_RE.sub(_replace_wildcards_or_whitespace, dialog)
+    try:
+        return re.compile("^" + dialog.strip())
+    except re.error:
+        return None
+
+
+def _normalize_text(text: str) -> str:
+    """Normalize text for comparison with spoken utterances."""
+    return text.lower().strip()
+
+
+def _normalized_utt(message: Message) -> str:
+    """Get normalized utterance from a speak message."""
+    try:
+        return _normalize_text(_get_utterance(message.data))
+    except KeyError:
+        return ""
+
 
 @given("an english speaking user")
 def given_english(context):
-    context.lang = "en-us"
+    context.lang = sys.intern("en-us")
 
 
 @when('the user says "{text}"')
@@ -46,15 +235,28 @@ def when_user_says(context, text: str):
     context.client.say_utterance(text)
 
 
-@then('"{skill}" should reply with dialog from "{dialog}"')
+# Variants of the same step are folded into a single regex
+use_step_matcher("re")
+
+
+@then(r'"(?P<skill>[^"]+)" should reply with dialog from(?: list)? "(?P<dialog>.+)"')
 def then_dialog(context, skill: str, dialog: str):
+    """Handle dialog or list of possible dialogs, separated by semi-colon (;)"""
+    skill = sys.intern(skill)
     context.client.match_dialogs_or_fail(dialog, skill_id=skill)
 
 
-@then('"{skill}" should reply with dialog from list "{dialog}"')
-def then_dialog_list(context, skill: str, dialog: str):
-    """Handle list of possible dialogs, separated by semi-colon (;)"""
-    context.client.match_dialogs_or_fail(dialog, skill_id=skill)
+@then(r'the user (?:replies with|replies|says) "(?P<text>.+)"')
+def then_user_follow_up(context, text: str):
+    """Send a user response after being prompted by device."""
+    message = context.client.wait_for_message("mycroft.mic.listen")
+    assert message is not None, "Did not receive listen message"
+    mycroft_session_id = message.data.get("mycroft_session_id")
+    context.client.say_utterance(text, mycroft_session_id=mycroft_session_id)
+
+
+# Back to the default for the remaining steps (and other step modules)
+use_step_matcher("parse")
 
 
 # @then('"{skill}" should not reply')
@@ -75,13 +277,15 @@ def then_dialog_list(context, skill: str, dialog: str):
 #     assert passed, assert_msg or "{} responded".format(skill)
 
 
-# @then('"{skill}" should reply with "{example}"')
-# def then_example(context, skill, example):
-#     skill_path = context.msm.find_skill(skill).path
-#     dialog = dialog_from_sentence(example, skill_path, context.lang)
-#     print("Matching with the dialog file: {}".format(dialog))
-#     assert dialog is not None, "No matching dialog..."
-#     then_dialog(context, skill, dialog)
+@then('"{skill}" should reply with "{example}"')
+def then_example(context, skill: str, example: str):
+    skills_dir = context.config.userdata.get("skills_dir")
+    assert skills_dir, "Skills directory not set (behave -D skills_dir=...)"
+    skill_path = join(skills_dir, skill)
+    dialog = dialog_from_sentence(example, skill_path, context.lang)
+    LOG.info("Matching with the dialog file: %s", dialog)
+    assert dialog is not None, "No matching dialog..."
+    then_dialog(context, skill, dialog)
 
 
 # @then('"{skill}" should reply with anything')
@@ -114,17 +318,18 @@ def then_dialog_list(context, skill: str, dialog: str):
 def then_contains(context, text: str):
     passed = False
     assert_message = "Mycroft didn't respond"
-    text = text.lower().strip()
+    text = _normalize_text(text)
 
-    maybe_message = context.client.get_next_speak()
-    if maybe_message is not None:
-        utterance = maybe_message.data.get("utterance", "")
-        utterance = utterance.lower().strip()
+    # Skills may speak multiple sentences, so check everything that was said
+    utterances = [_normalized_utt(m) for m in context.client.get_pending_speaks()]
+    if LOG.isEnabledFor(logging.DEBUG):
+        LOG.debug("Checking for %r in %r", text, utterances)
 
-        if text in utterance:
+    if utterances:
+        if any(text in utterance for utterance in utterances):
             passed = True
         else:
-            assert_message = f"Did not find '{text}' in '{utterance}'"
+            assert_message = f"Did not find '{text}' in {utterances}"
 
     assert passed, assert_message
 
@@ -133,7 +338,7 @@ def then_contains(context, text: str):
 def then_contains_skill(context, skill: str, text: str):
     passed = False
     assert_message = "Mycroft didn't respond"
-    text = text.lower().strip()
+    text = _normalize_text(text)
 
     maybe_message = context.client.get_next_speak()
     if maybe_message is not None:
@@ -144,8 +349,9 @@ def then_contains_skill(context, skill: str, text: str):
             assert_message = f"Expected skill '{skill}', got '{actual_skill}'"
         else:
             # Check utterance
-            utterance = maybe_message.data.get("utterance", "")
-            utterance = utterance.lower().strip()
+            utterance = _normalized_utt(maybe_message)
+            if LOG.isEnabledFor(logging.DEBUG):
+                LOG.debug("Checking for %r in %r", text, utterance)
 
             if text in utterance:
                 passed = True
@@ -155,17 +361,6 @@ def then_contains_skill(context, skill: str, text: str):
     assert passed, assert_message
 
 
-@then('the user replies with "{text}"')
-@then('the user replies "{text}"')
-@then('the user says "{text}"')
-def then_user_follow_up(context, text):
-    """Send a user response after being prompted by device."""
-    message = context.client.wait_for_message("mycroft.mic.listen")
-    assert message is not None, "Did not receive listen message"
-    mycroft_session_id = message.data.get("mycroft_session_id")
-    context.client.say_utterance(text, mycroft_session_id=mycroft_session_id)
-
-
 @then('mycroft should send the message "{message_type}"')
 def then_messagebus_message(context, message_type: str):
     """Verify a specific message is sent."""
@@ -175,4 +370,4 @@ def then_messagebus_message(context, message_type: str):
 
 @then("dialog is stopped")
 def dialog_is_stopped(context):
-    context.client.bus.emit(Message("mycroft.tts.stop"))
+    context.client.bus.emit(_STOP_MESSAGE)
@@ -29,7 +29,7 @@ if [ -z "$1" ]; then
     exit 1;
 fi
 
-skill_dir="$1"
+skill_dir="$(realpath "$1")"
 skill_id="$(basename "${skill_dir}")"
 skill_features_dir="${skill_dir}/test/behave"
 
@@ -74,4 +74,4 @@ source "${venv_dir}/bin/activate"
 
 cd "${skill_test_dir}" && \
     PYTHONPATH="${base_dir}:${PYTHONPATH}" \
-    behave "$@"
+    behave -D skills_dir="$(dirname "${skill_dir}")" "$@"